@@ -1,18 +1,49 @@
 """Client wrapper for the Reducto SDK."""
 
+import functools
 import os
 
-from dotenv import load_dotenv
-from reducto import Reducto
+# Whether .env has been loaded; dotenv and the SDK are imported lazily
+# so commands that never talk to the API don't pay their import cost.
+_dotenv_loaded = False
 
-# Load environment variables from .env file
-load_dotenv()
 
+def _build_http_client():
+    """
+    Build an httpx client tuned for a single CLI invocation.
+
+    Keep-alive connections let upload, job submission, and every status
+    poll reuse one TCP+TLS session instead of re-handshaking per call.
+    HTTP/2 is enabled when the optional h2 package is installed.
+
+    Returns:
+        Configured httpx.Client instance
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
 
-def get_client(environment: str = "production") -> Reducto:
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(environment: str = "production"):
     """
     Create and return a Reducto client.
 
+    Clients are cached per environment, so every call in a process —
+    upload, run_job, each job.get poll, or repeated invocations in a
+    long-lived caller — shares one instance and its pooled connection
+    rather than re-handshaking TLS per construction.
+
     Args:
         environment: The API environment to use (production, eu, or au)
 
@@ -22,6 +53,18 @@ def get_client(environment: str = "production") -> Reducto:
     Raises:
         ValueError: If REDUCTO_API_KEY is not set
     """
+    global _dotenv_loaded
+
+    # Only fall back to .env when the key isn't already exported: in
+    # the common shell/CI case this skips both the dotenv import and
+    # its filesystem walk entirely
+    if not _dotenv_loaded and "REDUCTO_API_KEY" not in os.environ:
+        from dotenv import load_dotenv
+
+        # Load environment variables from .env file
+        load_dotenv()
+        _dotenv_loaded = True
+
     api_key = os.environ.get("REDUCTO_API_KEY")
 
     if not api_key:
@@ -30,4 +73,10 @@ def get_client(environment: str = "production") -> Reducto:
             "Please set it in your environment or .env file."
         )
 
-    return Reducto(api_key=api_key, environment=environment)
+    from reducto import Reducto
+
+    return Reducto(
+        api_key=api_key,
+        environment=environment,
+        http_client=_build_http_client(),
+    )
@@ -1,18 +1,85 @@
 """Parse command implementation."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
 import typer
-import reducto
-from reducto._types import omit
 
 from ..client import get_client
-from ..utils import is_local_file, output_json, output_error, poll_job, save_json_to_file, console
+from ..utils import (
+    get_console,
+    is_local_file,
+    output_error,
+    output_json,
+    poll_job,
+    poll_jobs,
+    save_json_to_file,
+)
 
 app = typer.Typer()
 
+# Tables mapping parse() local variable names to API option keys. Each
+# group becomes one dict built in a single loop instead of a run of
+# per-option `if x is not None` blocks.
+_ENHANCE_MAP = (
+    ("enhance_summarize_figures", "summarize_figures"),
+)
+_FORMATTING_MAP = (
+    ("formatting_add_page_markers", "add_page_markers"),
+    ("formatting_merge_tables", "merge_tables"),
+    ("formatting_table_output_format", "table_output_format"),
+    ("formatting_include", "include"),
+)
+_RETRIEVAL_MAP = (
+    ("retrieval_embedding_optimized", "embedding_optimized"),
+    ("retrieval_filter_blocks", "filter_blocks"),
+)
+_CHUNKING_MAP = (
+    ("retrieval_chunking_mode", "chunk_mode"),
+    ("retrieval_chunking_size", "chunk_size"),
+)
+_SETTINGS_MAP = (
+    ("settings_document_password", "document_password"),
+    ("settings_page_range", "page_range"),
+    ("settings_return_images", "return_images"),
+    ("settings_return_ocr_data", "return_ocr_data"),
+    ("settings_timeout", "timeout"),
+    ("settings_ocr_system", "ocr_system"),
+    ("settings_persist_results", "persist_results"),
+    ("settings_force_url_result", "force_url_result"),
+    ("settings_embed_pdf_metadata", "embed_pdf_metadata"),
+    ("settings_force_file_extension", "force_file_extension"),
+)
+_SPLIT_LARGE_TABLES_MAP = (
+    ("spreadsheet_split_large_tables", "enabled"),
+    ("spreadsheet_split_large_tables_size", "size"),
+)
+_SPREADSHEET_MAP = (
+    ("spreadsheet_include", "include"),
+    ("spreadsheet_clustering", "clustering"),
+    ("spreadsheet_exclude", "exclude"),
+)
+
+
+def _collect_options(local_vars, mapping):
+    """
+    Build an API option dict from bound CLI locals.
+
+    Args:
+        local_vars: The parse() locals() mapping
+        mapping: Tuple of (local_name, api_key) pairs
+
+    Returns:
+        Dict of api_key -> value for all non-None locals
+    """
+    return {key: local_vars[name] for name, key in mapping if local_vars[name] is not None}
+
+
+# Allowed values for --settings-return-images; module-level so the set
+# isn't rebuilt on every validation call
+_VALID_RETURN_IMAGES = frozenset(("figure", "table"))
+
 
 def validate_return_images(values: Optional[List[str]]) -> Optional[List[str]]:
     """
@@ -27,56 +94,65 @@ def validate_return_images(values: Optional[List[str]]) -> Optional[List[str]]:
     Raises:
         typer.BadParameter: If any value is not 'figure' or 'table'
     """
-    if values is None:
-        return None
-
-    valid_values = {'figure', 'table'}
-    for value in values:
-        if value not in valid_values:
-            raise typer.BadParameter(
-                f"Invalid value '{value}'. "
-                f"Only 'figure' and 'table' are allowed for --settings-return-images.\n"
-                f"Example: --settings-return-images figure --settings-return-images table"
-            )
+    if not values:
+        return values
+
+    invalid = set(values) - _VALID_RETURN_IMAGES
+    if invalid:
+        raise typer.BadParameter(
+            f"Invalid value(s) {sorted(invalid)}. "
+            f"Only 'figure' and 'table' are allowed for --settings-return-images.\n"
+            f"Example: --settings-return-images figure --settings-return-images table"
+        )
     return values
 
 
-def upload_file(client, file_path: Path):
-    """
-    Upload a file to Reducto.
-
-    Args:
-        client: The Reducto client
-        file_path: Path to the file to upload
-
-    Returns:
-        Upload result with file_id
-    """
-    return client.upload(file=file_path)
-
-
-def create_parse_job(client, **kwargs):
+def _result_output_path(
+    input_source: str, input_is_local: bool, job_id, output, disambiguate: bool = False
+) -> Path:
     """
-    Create a parse job.
+    Determine the output filename for one parse result.
 
     Args:
-        client: The Reducto client
-        **kwargs: Arguments to pass to client.parse.run_job
+        input_source: The original input string
+        input_is_local: Whether the input was a local file
+        job_id: The job ID (used for URLs or reducto:// IDs)
+        output: Explicit --output value, if any
+        disambiguate: Whether the default name collides with another
+            input's (same stem from different directories)
 
     Returns:
-        Job response with job_id
+        Path to write the result to
     """
-    return client.parse.run_job(**kwargs)
+    if output:
+        return Path(output)
+    if input_is_local:
+        # Use basename of input file; suffix with the job ID when two
+        # inputs would otherwise write to the same default name
+        stem = Path(input_source).stem
+        if disambiguate:
+            return Path(f"{stem}_{job_id}.json")
+        return Path(f"{stem}.json")
+    # Use job_id for URLs or reducto:// IDs
+    return Path(f"reducto_{job_id}.json")
 
 
 @app.command()
 def parse(
-    input_source: str = typer.Argument(..., help="Input: file path, URL, or reducto:// prefix"),
+    input_sources: List[str] = typer.Argument(
+        ..., help="Input(s): file paths, URLs, or reducto:// prefixes"
+    ),
     # Environment
     environment: str = typer.Option(
         "production",
         help="API environment (production, eu, or au)",
     ),
+    sync: bool = typer.Option(
+        False,
+        "--sync/--async",
+        help="Parse in a single synchronous request instead of submitting a job and polling "
+        "(lower latency for small documents; falls back to async on timeout)",
+    ),
     # Enhance options
     enhance_summarize_figures: Optional[bool] = typer.Option(
         None,
@@ -237,155 +313,168 @@ def parse(
     ),
 ):
     """
-    Parse a document using Reducto API.
+    Parse one or more documents using Reducto API.
 
     Automatically uploads local files before parsing.
-    Uses async parsing with job polling.
+    Uses async parsing with job polling; multiple inputs share one
+    client and are uploaded and polled concurrently.
     """
-    try:
-        client = get_client(environment=environment)
-
-        # Auto-upload local files
-        parse_input = input_source
-        if is_local_file(input_source):
-            file_path = Path(input_source)
-            upload_result = upload_file(client, file_path)
-            parse_input = upload_result.file_id
-
-        # Build options dictionaries
-        enhance = omit
-        enhance_dict = {}
-        if enhance_summarize_figures is not None:
-            enhance_dict["summarize_figures"] = enhance_summarize_figures
-
-        # Build agentic array
-        agentic = []
-        if enhance_agentic_table:
-            table_agentic = {"scope": "table"}
-            if enhance_agentic_table_prompt:
-                table_agentic["prompt"] = enhance_agentic_table_prompt
-            agentic.append(table_agentic)
-        if enhance_agentic_figure:
-            figure_agentic = {"scope": "figure"}
-            if enhance_agentic_figure_prompt:
-                figure_agentic["prompt"] = enhance_agentic_figure_prompt
-            agentic.append(figure_agentic)
-        if enhance_agentic_text:
-            agentic.append({"scope": "text"})
-        if agentic:
-            enhance_dict["agentic"] = agentic
-
-        if enhance_dict:
-            enhance = enhance_dict
-
-        formatting = omit
-        formatting_dict = {}
-        if formatting_add_page_markers is not None:
-            formatting_dict["add_page_markers"] = formatting_add_page_markers
-        if formatting_merge_tables is not None:
-            formatting_dict["merge_tables"] = formatting_merge_tables
-        if formatting_table_output_format is not None:
-            formatting_dict["table_output_format"] = formatting_table_output_format
-        if formatting_include is not None:
-            formatting_dict["include"] = formatting_include
-        if formatting_dict:
-            formatting = formatting_dict
-
-        retrieval = omit
-        retrieval_dict = {}
-        if retrieval_embedding_optimized is not None:
-            retrieval_dict["embedding_optimized"] = retrieval_embedding_optimized
-        if retrieval_filter_blocks is not None:
-            retrieval_dict["filter_blocks"] = retrieval_filter_blocks
-
-        # Build chunking dict
-        chunking_dict = {}
-        if retrieval_chunking_mode is not None:
-            chunking_dict["chunk_mode"] = retrieval_chunking_mode
-        if retrieval_chunking_size is not None:
-            chunking_dict["chunk_size"] = retrieval_chunking_size
-        if chunking_dict:
-            retrieval_dict["chunking"] = chunking_dict
-
-        if retrieval_dict:
-            retrieval = retrieval_dict
-
-        settings = omit
-        settings_dict = {}
-        if settings_document_password is not None:
-            settings_dict["document_password"] = settings_document_password
-        if settings_page_range is not None:
-            settings_dict["page_range"] = settings_page_range
-        if settings_return_images is not None:
-            settings_dict["return_images"] = settings_return_images
-        if settings_return_ocr_data is not None:
-            settings_dict["return_ocr_data"] = settings_return_ocr_data
-        if settings_timeout is not None:
-            settings_dict["timeout"] = float(settings_timeout)
-        if settings_ocr_system is not None:
-            settings_dict["ocr_system"] = settings_ocr_system
-        if settings_persist_results is not None:
-            settings_dict["persist_results"] = settings_persist_results
-        if settings_force_url_result is not None:
-            settings_dict["force_url_result"] = settings_force_url_result
-        if settings_embed_pdf_metadata is not None:
-            settings_dict["embed_pdf_metadata"] = settings_embed_pdf_metadata
-        if settings_force_file_extension is not None:
-            settings_dict["force_file_extension"] = settings_force_file_extension
-        if settings_dict:
-            settings = settings_dict
-
-        spreadsheet = omit
-        spreadsheet_dict = {}
-
-        # Build split_large_tables dict
-        split_large_tables_dict = {}
-        if spreadsheet_split_large_tables is not None:
-            split_large_tables_dict["enabled"] = spreadsheet_split_large_tables
-        if spreadsheet_split_large_tables_size is not None:
-            split_large_tables_dict["size"] = spreadsheet_split_large_tables_size
-        if split_large_tables_dict:
-            spreadsheet_dict["split_large_tables"] = split_large_tables_dict
-
-        if spreadsheet_include is not None:
-            spreadsheet_dict["include"] = spreadsheet_include
-        if spreadsheet_clustering is not None:
-            spreadsheet_dict["clustering"] = spreadsheet_clustering
-        if spreadsheet_exclude is not None:
-            spreadsheet_dict["exclude"] = spreadsheet_exclude
-
-        if spreadsheet_dict:
-            spreadsheet = spreadsheet_dict
-
-        # Start async parse job
-        job_response = create_parse_job(
-            client,
-            input=parse_input,
-            enhance=enhance,
-            formatting=formatting,
-            retrieval=retrieval,
-            settings=settings,
-            spreadsheet=spreadsheet,
+    _run_parse(locals())
+
+
+def _build_parse_options(opts, omit):
+    """
+    Assemble the five API option groups from the bound CLI options.
+
+    Args:
+        opts: Mapping of parse() option names to their bound values
+        omit: The SDK sentinel used for absent option groups
+
+    Returns:
+        Dict of run_job/run keyword arguments (enhance, formatting,
+        retrieval, settings, spreadsheet)
+    """
+    enhance_dict = _collect_options(opts, _ENHANCE_MAP)
+
+    # Build agentic array from the enabled scopes
+    agentic = [
+        {"scope": scope, **({"prompt": prompt} if prompt else {})}
+        for scope, enabled, prompt in (
+            ("table", opts["enhance_agentic_table"], opts["enhance_agentic_table_prompt"]),
+            ("figure", opts["enhance_agentic_figure"], opts["enhance_agentic_figure_prompt"]),
+            ("text", opts["enhance_agentic_text"], None),
         )
+        if enabled
+    ]
+    if agentic:
+        enhance_dict["agentic"] = agentic
 
-        # Poll until complete
-        job_result = poll_job(client, job_response.job_id, timeout=settings_timeout)
+    formatting_dict = _collect_options(opts, _FORMATTING_MAP)
+
+    retrieval_dict = _collect_options(opts, _RETRIEVAL_MAP)
+    chunking_dict = _collect_options(opts, _CHUNKING_MAP)
+    if chunking_dict:
+        retrieval_dict["chunking"] = chunking_dict
+
+    settings_dict = _collect_options(opts, _SETTINGS_MAP)
+    if "timeout" in settings_dict:
+        settings_dict["timeout"] = float(settings_dict["timeout"])
+
+    spreadsheet_dict = _collect_options(opts, _SPREADSHEET_MAP)
+    split_large_tables_dict = _collect_options(opts, _SPLIT_LARGE_TABLES_MAP)
+    if split_large_tables_dict:
+        spreadsheet_dict["split_large_tables"] = split_large_tables_dict
+
+    return dict(
+        enhance=enhance_dict or omit,
+        formatting=formatting_dict or omit,
+        retrieval=retrieval_dict or omit,
+        settings=settings_dict or omit,
+        spreadsheet=spreadsheet_dict or omit,
+    )
 
-        # Determine output filename
-        if output:
-            output_file = Path(output)
-        elif is_local_file(input_source):
-            # Use basename of input file
-            input_path = Path(input_source)
-            output_file = Path(f"{input_path.stem}.json")
-        else:
-            # Use job_id for URLs or reducto:// IDs
-            output_file = Path(f"reducto_{job_response.job_id}.json")
 
-        # Save the result to file
-        save_json_to_file(job_result, output_file)
-        console.print(f"✓ Saved to {output_file}", style="green")
+def _run_parse(opts):
+    """
+    Implementation behind the parse command.
+
+    Kept separate from the Typer-bound signature so the registered
+    callback stays a thin shim and the real logic works on a plain
+    options mapping.
+
+    Args:
+        opts: Mapping of parse() option names to their bound values
+    """
+    # Deferred so `reducto --help` doesn't import the SDK
+    import reducto
+    from reducto._types import omit
+
+    input_sources = opts["input_sources"]
+    output = opts["output"]
+    settings_timeout = opts["settings_timeout"]
 
+    if output and len(input_sources) > 1:
+        output_error("--output cannot be used with multiple inputs")
+        raise typer.Exit(code=1)
+
+    try:
+        client = get_client(environment=opts["environment"])
+
+        base_kwargs = _build_parse_options(opts, omit)
+
+        # Auto-upload local files; checked once per input and reused
+        # for output naming. Parallel uploads when parsing several.
+        local_flags = [is_local_file(source) for source in input_sources]
+
+        # Inputs with the same stem from different directories would
+        # default to the same output name; detect collisions up front so
+        # one result never silently overwrites another
+        stems = [Path(s).stem for s, local in zip(input_sources, local_flags) if local]
+        colliding_stems = {stem for stem in stems if stems.count(stem) > 1}
+
+        def resolve_input(source, local):
+            if not local:
+                return source
+            # Open handle so httpx streams the upload in constant memory
+            # instead of reading the whole file up front
+            with Path(source).open("rb") as f:
+                return client.upload(file=f).file_id
+
+        if len(input_sources) == 1:
+            parse_inputs = [resolve_input(input_sources[0], local_flags[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                parse_inputs = list(pool.map(resolve_input, input_sources, local_flags))
+
+        def save_result(source, local, job_id, job_result):
+            output_file = _result_output_path(
+                source,
+                local,
+                job_id,
+                output,
+                disambiguate=local and Path(source).stem in colliding_stems,
+            )
+            save_json_to_file(job_result, output_file)
+            get_console().print(f"✓ Saved to {output_file}", style="green")
+
+        pending = list(zip(input_sources, local_flags, parse_inputs))
+
+        if opts["sync"]:
+            # Single request per input; the server holds the connection
+            # until done, avoiding round-trips and poll-interval latency
+            still_pending = []
+            for source, local, parse_input in pending:
+                try:
+                    job_result = client.parse.run(input=parse_input, **base_kwargs)
+                    save_result(source, local, job_result.job_id, job_result)
+                except reducto.APITimeoutError:
+                    still_pending.append((source, local, parse_input))
+            pending = still_pending
+
+        # Submit the remaining inputs as async jobs, then wait
+        jobs = [
+            (source, local, client.parse.run_job(input=parse_input, **base_kwargs).job_id)
+            for source, local, parse_input in pending
+        ]
+
+        if len(jobs) == 1:
+            source, local, job_id = jobs[0]
+            job_result = poll_job(client, job_id, timeout=settings_timeout)
+            save_result(source, local, job_id, job_result)
+        elif jobs:
+            results, failures = poll_jobs(
+                client, [job_id for _, _, job_id in jobs], timeout=settings_timeout
+            )
+            for source, local, job_id in jobs:
+                if job_id in results:
+                    save_result(source, local, job_id, results[job_id])
+            if failures:
+                for job_id, error_msg in failures.items():
+                    output_error(f"Job {job_id} failed: {error_msg}")
+                raise typer.Exit(code=1)
+
+    except typer.Exit:
+        raise
     except reducto.APIError as error:
         output_error("API error", error)
         raise typer.Exit(code=1)
@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-import reducto
 
 from ..client import get_client
 from ..utils import output_json, output_error
@@ -25,6 +24,9 @@ def upload(
     ),
 ):
     """Upload a file to Reducto."""
+    # Deferred so `reducto --help` doesn't import the SDK
+    import reducto
+
     file_path = Path(file)
 
     if not file_path.exists():
@@ -37,7 +39,9 @@ def upload(
 
     try:
         client = get_client(environment=environment)
-        upload_result = client.upload(file=file_path, extension=extension)
+        # Open handle so httpx streams the upload instead of buffering it
+        with file_path.open("rb") as f:
+            upload_result = client.upload(file=f, extension=extension)
         output_json(upload_result)
     except reducto.APIError as error:
         output_error("API error", error)
@@ -1,7 +1,6 @@
 """Version command implementation."""
 
 import typer
-import reducto
 
 from ..client import get_client
 from ..utils import output_json, output_error
@@ -17,6 +16,9 @@ def version(
     ),
 ):
     """Get the API version information."""
+    # Deferred so `reducto --help` doesn't import the SDK
+    import reducto
+
     try:
         client = get_client(environment=environment)
         version_info = client.api_version()
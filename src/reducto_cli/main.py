@@ -1,5 +1,7 @@
 """Main CLI entry point."""
 
+import sys
+
 import typer
 
 from .commands import version, upload, parse
@@ -8,6 +10,9 @@ app = typer.Typer(
     name="reducto",
     help="A CLI wrapper for the Reducto API",
     no_args_is_help=True,
+    # Rich-rendered help is only worth paying for on an interactive
+    # terminal; piped output gets plain Click formatting
+    rich_markup_mode="rich" if sys.stdout.isatty() else None,
 )
 
 # Register commands
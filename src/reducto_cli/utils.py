@@ -1,29 +1,94 @@
 """Utility functions for the CLI."""
 
+import asyncio
+import functools
 import json
+import os
+import stat
 import sys
 import time
 from pathlib import Path
 from typing import Any, Optional
 
-from rich.console import Console
-from rich.spinner import Spinner
-from rich.live import Live
+try:
+    import orjson
+except ImportError:  # Soft dependency; fall back to stdlib json
+    orjson = None
 
-console = Console()
+
+@functools.lru_cache(maxsize=None)
+def get_console():
+    """
+    Return the shared Rich console, constructing it on first use.
+
+    Rich is imported lazily so commands that never render a spinner
+    (version, upload) skip its import cost entirely.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+# Remote schemes that can never be local files; module-level so the
+# tuple lives in one place instead of being rebuilt per call
+_NON_LOCAL_PREFIXES = ("http://", "https://", "reducto://", "s3://", "gs://")
+
+# Short-TTL cache of full stat results (misses included), so one
+# syscall serves every question about a path — existence, file type,
+# size for upload decisions — within one invocation
+_STAT_TTL = 1.0
+_stat_cache = {}  # {path: (stat_result | None, timestamp)}
+
+
+def _stat_cached(path: str):
+    """
+    Return a cached os.stat result for path, or None if it doesn't exist.
+
+    Both hits and misses are cached for _STAT_TTL seconds; callers that
+    need st_size or st_mtime after an is_local_file check reuse the
+    same stat instead of re-statting.
+
+    Args:
+        path: The path to stat
+
+    Returns:
+        The stat_result, or None if the path can't be statted
+    """
+    now = time.monotonic()
+    cached = _stat_cache.get(path)
+    if cached is not None and now - cached[1] < _STAT_TTL:
+        return cached[0]
+
+    try:
+        result = os.stat(path)
+    except (OSError, ValueError):
+        result = None
+
+    _stat_cache[path] = (result, now)
+    return result
 
 
 def is_local_file(input_str: str) -> bool:
     """
     Check if the input string is a local file path.
 
+    Remote-scheme detection is a pure string check and always runs
+    before any cache lookup or filesystem access, so URL and
+    reducto:// inputs never cost a syscall.
+
     Args:
         input_str: The input string to check
 
     Returns:
         True if the input is a local file, False otherwise
     """
-    return Path(input_str).exists()
+    # Known remote schemes never touch the filesystem (or the cache);
+    # a stat on a networked filesystem can block for seconds
+    if input_str.startswith(_NON_LOCAL_PREFIXES):
+        return False
+
+    st = _stat_cached(input_str)
+    return st is not None and stat.S_ISREG(st.st_mode)
 
 
 def output_json(data: Any) -> None:
@@ -33,14 +98,25 @@ def output_json(data: Any) -> None:
     Args:
         data: The data to output (must be JSON serializable)
     """
-    # Convert Pydantic models to dict
-    if hasattr(data, "model_dump"):
-        data = data.model_dump()
-    elif hasattr(data, "to_dict"):
-        data = data.to_dict()
-
-    json.dump(data, sys.stdout, indent=2)
-    print()  # Add newline at the end
+    # Pydantic models serialize straight to JSON in pydantic-core,
+    # skipping the intermediate dict entirely
+    if hasattr(data, "model_dump_json"):
+        payload = data.model_dump_json(indent=2).encode("utf-8")
+    else:
+        if hasattr(data, "model_dump"):
+            data = data.model_dump(mode="json")
+        elif hasattr(data, "to_dict"):
+            data = data.to_dict()
+
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+
+    # One write syscall for the whole payload, bypassing the
+    # TextIOWrapper's per-chunk encoding and print()'s locking
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def save_json_to_file(data: Any, file_path: Path) -> None:
@@ -51,14 +127,24 @@ def save_json_to_file(data: Any, file_path: Path) -> None:
         data: The data to save (must be JSON serializable)
         file_path: The path where the file should be saved
     """
-    # Convert Pydantic models to dict
+    # Pydantic models serialize straight to JSON in pydantic-core,
+    # skipping the intermediate dict entirely
+    if hasattr(data, "model_dump_json"):
+        with open(file_path, "w") as f:
+            f.write(data.model_dump_json(indent=2))
+        return
+
     if hasattr(data, "model_dump"):
-        data = data.model_dump()
+        data = data.model_dump(mode="json")
     elif hasattr(data, "to_dict"):
         data = data.to_dict()
 
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=2)
 
 
 def output_error(message: str, error: Optional[Exception] = None) -> None:
@@ -77,9 +163,16 @@ def output_error(message: str, error: Optional[Exception] = None) -> None:
             error_data["status_code"] = error.status_code
         if hasattr(error, "response"):
             try:
+                # Already-parsed body is embedded as-is; output_json
+                # serializes it once, no re-encode round-trip
                 error_data["response"] = error.response.json()
             except Exception:
-                error_data["response"] = str(error.response)
+                # Not JSON: keep the raw text, truncated so a huge
+                # error body can't balloon the output
+                try:
+                    error_data["response"] = error.response.text[:4096]
+                except Exception:
+                    error_data["response"] = str(error.response)[:4096]
 
     output_json(error_data)
 
@@ -103,10 +196,53 @@ def format_elapsed_time(seconds: float) -> str:
     return f"{minutes}m {remaining_seconds}s"
 
 
+# Poll backoff schedule: start small so short jobs complete with almost
+# no added latency, double each iteration to cut request volume for long
+# jobs, and cap so worst-case completion detection stays bounded.
+_POLL_DELAY_INITIAL = 0.25
+_POLL_DELAY_CAP = 10.0
+
+
+def _next_poll_delay(job_status, elapsed: float, backoff_delay: float) -> float:
+    """
+    Pick the next poll delay, preferring a progress-rate estimate.
+
+    When the status carries a fractional progress field, the observed
+    rate predicts the remaining time, so the next poll can be scheduled
+    right around expected completion instead of on a blind schedule.
+    Falls back to the exponential backoff delay when no usable progress
+    is available.
+
+    Args:
+        job_status: The job status object (progress read if present)
+        elapsed: Seconds since polling started
+        backoff_delay: The current exponential backoff delay
+
+    Returns:
+        Seconds to sleep before the next poll
+    """
+    progress = getattr(job_status, "progress", None)
+    if isinstance(progress, (int, float)) and 0 < progress < 1 and elapsed > 0:
+        estimated_remaining = (1 - progress) * elapsed / progress
+        return min(max(estimated_remaining, _POLL_DELAY_INITIAL), _POLL_DELAY_CAP)
+    return backoff_delay
+
+
+# Memoized job statuses so multiple callers within one poll tick (e.g.
+# a progress display plus a terminal check) share one HTTP request
+_STATUS_TTL = 0.25
+_status_cache = {}  # {job_id: (status, timestamp)}
+
+
 def get_job_status(client, job_id: str) -> Any:
     """
     Get the status of a job.
 
+    Non-terminal results are memoized for a quarter second, so callers
+    asking about the same job within one poll tick share a single HTTP
+    request. Terminal statuses invalidate the entry so a finished job
+    is never reported from cache.
+
     Args:
         client: The Reducto client
         job_id: The job ID to check
@@ -114,7 +250,19 @@ def get_job_status(client, job_id: str) -> Any:
     Returns:
         The job status object
     """
-    return client.job.get(job_id)
+    now = time.monotonic()
+    cached = _status_cache.get(job_id)
+    if cached is not None and now - cached[1] < _STATUS_TTL:
+        return cached[0]
+
+    job_status = client.job.get(job_id)
+
+    if str(getattr(job_status, "status", "")).lower() in ("completed", "failed"):
+        _status_cache.pop(job_id, None)
+    else:
+        _status_cache[job_id] = (job_status, now)
+
+    return job_status
 
 
 def poll_job(client, job_id: str, timeout: Optional[int] = None) -> Any:
@@ -133,33 +281,221 @@ def poll_job(client, job_id: str, timeout: Optional[int] = None) -> Any:
         TimeoutError: If the timeout is reached
         Exception: If the job fails
     """
+    # Deferred so commands that never poll don't import rich.live/spinner
+    from rich.live import Live
+    from rich.spinner import Spinner
+
+    console = get_console()
     spinner = Spinner("dots", text=f"Processing job {job_id}...")
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = None if timeout is None else start_time + timeout
+    delay = _POLL_DELAY_INITIAL  # Short jobs are detected almost immediately
+    last_elapsed_int = -1
 
     with Live(spinner, console=console, transient=True) as live:
         while True:
-            job_status = get_job_status(client, job_id)
-            elapsed = time.time() - start_time
-            elapsed_str = format_elapsed_time(elapsed)
-
-            if job_status.status.lower() == "completed":
+            # Direct call: no wrapper frame in the poll loop
+            job_status = client.job.get(job_id)
+            # Single clock read per iteration; elapsed display and the
+            # deadline check are both derived from it
+            now = time.monotonic()
+            elapsed = now - start_time
+            status = job_status.status.lower()
+
+            if status == "completed":
                 live.stop()
-                console.print(f"✓ Parsing completed in {elapsed_str}", style="green")
+                console.print(
+                    f"✓ Parsing completed in {format_elapsed_time(elapsed)}", style="green"
+                )
                 return job_status
 
-            if job_status.status.lower() == "failed":
+            if status == "failed":
                 live.stop()
                 error_msg = getattr(job_status, "error", "Unknown error")
                 raise Exception(f"Job failed: {error_msg}")
 
             # Check timeout
-            if timeout is not None:
-                if elapsed >= timeout:
-                    live.stop()
-                    raise TimeoutError(f"Job timed out after {timeout} seconds")
+            if deadline is not None and now >= deadline:
+                live.stop()
+                raise TimeoutError(f"Job timed out after {timeout} seconds")
+
+            # Update spinner text only when the displayed time actually changes
+            elapsed_int = int(elapsed)
+            if elapsed_int != last_elapsed_int:
+                spinner.text = f"Processing job {job_id}... {format_elapsed_time(elapsed)}"
+                live.update(spinner)
+                last_elapsed_int = elapsed_int
+
+            time.sleep(_next_poll_delay(job_status, elapsed, delay))
+            delay = min(_POLL_DELAY_CAP, delay * 2)  # Double per iteration, capped
+
+
+async def _stream_job_events(base_url: str, api_key: str, job_id: str, timeout) -> Any:
+    """
+    Wait for a terminal job status on the server-push events stream.
 
-            # Update spinner text with job ID and elapsed time
-            status_text = getattr(job_status, "status", "processing")
-            live.update(Spinner("dots", text=f"Processing job {job_id}... {elapsed_str}"))
+    Blocks on the SSE response instead of asking repeatedly; the server
+    notifies us when the job reaches a terminal state.
 
-            time.sleep(5)  # Poll every 5 seconds
+    Args:
+        base_url: The API base URL
+        api_key: The API key for the Authorization header
+        job_id: The job ID to wait for
+        timeout: Optional read timeout in seconds
+
+    Returns:
+        The terminal event payload
+
+    Raises:
+        httpx.HTTPError: If the events endpoint is unavailable
+        RuntimeError: If the stream ends without a terminal status
+        Exception: If the job fails
+    """
+    import httpx
+
+    headers = {"Accept": "text/event-stream", "Authorization": f"Bearer {api_key}"}
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout, connect=10)) as http:
+        url = f"{base_url.rstrip('/')}/jobs/{job_id}/events"
+        async with http.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[len("data:"):].strip())
+                status = str(event.get("status", "")).lower()
+                if status == "completed":
+                    return event
+                if status == "failed":
+                    error_msg = event.get("error", "Unknown error")
+                    raise Exception(f"Job failed: {error_msg}")
+
+    raise RuntimeError("Event stream ended without a terminal status")
+
+
+def await_job(client, job_id: str, timeout: Optional[int] = None) -> Any:
+    """
+    Wait for a job, preferring server push over polling.
+
+    Tries the job events stream first so completion is delivered the
+    moment the server knows about it, with zero status requests in
+    between. If the events endpoint is unavailable (404, transport
+    error, or a stream that ends early), falls back to poll_job.
+
+    Args:
+        client: The Reducto client
+        job_id: The job ID to wait for
+        timeout: Optional timeout in seconds
+
+    Returns:
+        The job result
+
+    Raises:
+        TimeoutError: If the timeout is reached
+        Exception: If the job fails
+    """
+    base_url = getattr(client, "base_url", None)
+    api_key = getattr(client, "api_key", None)
+
+    if base_url and api_key:
+        import httpx
+
+        try:
+            return asyncio.run(_stream_job_events(str(base_url), api_key, job_id, timeout))
+        except (httpx.HTTPError, RuntimeError, ValueError):
+            # Events endpoint unavailable or stream unusable; poll instead
+            pass
+
+    return poll_job(client, job_id, timeout=timeout)
+
+
+def poll_jobs(client, job_ids, timeout: Optional[int] = None):
+    """
+    Poll several jobs in one loop, sweeping all pending IDs per tick.
+
+    One backoff interval covers every pending job, so waiting on N jobs
+    costs one poll loop of wall time instead of N sequential ones.
+
+    Args:
+        client: The Reducto client
+        job_ids: Job IDs to wait for
+        timeout: Optional overall timeout in seconds
+
+    Returns:
+        Tuple of ({job_id: result}, {job_id: error message})
+
+    Raises:
+        TimeoutError: If the timeout is reached with jobs still pending
+    """
+    results = {}
+    failures = {}
+    pending = list(job_ids)
+    start_time = time.monotonic()
+    delay = _POLL_DELAY_INITIAL
+
+    while pending:
+        still_pending = []
+        for job_id in pending:
+            job_status = client.job.get(job_id)
+            status = job_status.status.lower()
+            if status == "completed":
+                results[job_id] = job_status
+            elif status == "failed":
+                failures[job_id] = getattr(job_status, "error", "Unknown error")
+            else:
+                still_pending.append(job_id)
+        pending = still_pending
+
+        if pending:
+            if timeout is not None and time.monotonic() - start_time >= timeout:
+                raise TimeoutError(f"Jobs timed out after {timeout} seconds: {pending}")
+            time.sleep(delay)
+            delay = min(_POLL_DELAY_CAP, delay * 2)
+
+    return results, failures
+
+
+async def poll_job_async(client, job_id: str, timeout: Optional[int] = None) -> Any:
+    """
+    Async counterpart of poll_job for AsyncReducto clients.
+
+    The timeout is enforced as a hard deadline via asyncio.wait_for on
+    each status request, rather than checked after the fact between
+    sleeps, so cancellation is deterministic regardless of poll
+    granularity. No spinner is shown; callers drive their own display.
+
+    Args:
+        client: An async Reducto client (job.get must be awaitable)
+        job_id: The job ID to poll
+        timeout: Optional timeout in seconds
+
+    Returns:
+        The job result
+
+    Raises:
+        TimeoutError: If the timeout is reached
+        Exception: If the job fails
+    """
+    start_time = time.monotonic()
+    delay = _POLL_DELAY_INITIAL
+
+    while True:
+        remaining = None
+        if timeout is not None:
+            remaining = timeout - (time.monotonic() - start_time)
+            if remaining <= 0:
+                raise TimeoutError(f"Job timed out after {timeout} seconds")
+
+        try:
+            job_status = await asyncio.wait_for(client.job.get(job_id), timeout=remaining)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Job timed out after {timeout} seconds")
+
+        status = job_status.status.lower()
+        if status == "completed":
+            return job_status
+        if status == "failed":
+            error_msg = getattr(job_status, "error", "Unknown error")
+            raise Exception(f"Job failed: {error_msg}")
+
+        await asyncio.sleep(_next_poll_delay(job_status, time.monotonic() - start_time, delay))
+        delay = min(_POLL_DELAY_CAP, delay * 2)
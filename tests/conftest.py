@@ -1,7 +1,9 @@
 """Pytest configuration and fixtures."""
 
+import json
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -15,9 +17,15 @@ def temp_pdf_file(tmp_path):
     return pdf_file
 
 
+# Fixtures use SimpleNamespace rather than MagicMock wherever no call
+# tracking is needed: construction is a plain allocation instead of
+# MagicMock's __getattr__/_mock_children machinery, and attribute typos
+# fail loudly instead of silently returning child mocks.
+
+
 @pytest.fixture
 def mock_reducto_client():
-    """Create a mock Reducto client."""
+    """Create a mock Reducto client (MagicMock: calls are asserted on)."""
     client = MagicMock()
     return client
 
@@ -25,52 +33,44 @@ def mock_reducto_client():
 @pytest.fixture
 def mock_upload_result():
     """Create a mock upload result."""
-    result = MagicMock()
-    result.file_id = "reducto://mock-file-id-123"
-    return result
+    return SimpleNamespace(file_id="reducto://mock-file-id-123")
 
 
 @pytest.fixture
 def mock_job_response():
     """Create a mock job response."""
-    response = MagicMock()
-    response.job_id = "mock-job-id-456"
-    return response
+    return SimpleNamespace(job_id="mock-job-id-456")
 
 
 @pytest.fixture
 def mock_job_status_completed():
     """Create a mock completed job status."""
-    status = MagicMock()
-    status.status = "completed"
-    status.job_id = "mock-job-id-456"
-    status.result = {"chunks": [], "blocks": []}
-    # Make model_dump return a dict for JSON serialization
-    status.model_dump.return_value = {
+    data = {
         "status": "completed",
         "job_id": "mock-job-id-456",
         "result": {"chunks": [], "blocks": []}
     }
+    status = SimpleNamespace(**data)
+    # Mirror the Pydantic serialization surface the CLI relies on
+    status.model_dump = lambda **kwargs: data
+    status.model_dump_json = lambda **kwargs: json.dumps(data, indent=2)
     return status
 
 
 @pytest.fixture
 def mock_job_status_processing():
     """Create a mock processing job status."""
-    status = MagicMock()
-    status.status = "processing"
-    status.job_id = "mock-job-id-456"
-    return status
+    return SimpleNamespace(status="processing", job_id="mock-job-id-456")
 
 
 @pytest.fixture
 def mock_job_status_failed():
     """Create a mock failed job status."""
-    status = MagicMock()
-    status.status = "failed"
-    status.job_id = "mock-job-id-456"
-    status.error = "Processing failed"
-    return status
+    return SimpleNamespace(
+        status="failed",
+        job_id="mock-job-id-456",
+        error="Processing failed",
+    )
 
 
 @pytest.fixture
@@ -6,13 +6,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from typer.testing import CliRunner
 
-from reducto_cli.commands.parse import upload_file, create_parse_job
 from reducto_cli.main import app
 
 runner = CliRunner()
 
 
 def test_parse_local_file_success(
+    tmp_path,
     temp_pdf_file,
     mock_reducto_client,
     mock_upload_result,
@@ -27,65 +27,131 @@ def test_parse_local_file_success(
     1. Upload local file
     2. Create parse job
     3. Poll job status using client.job.get() (not .retrieve())
-    4. Return completed result
+    4. Save completed result
 
     This prevents regression of the bug where poll_job() called
     client.job.retrieve() instead of client.job.get().
     """
-    # Mock the wrapper functions
+    output_file = tmp_path / "result.json"
+
     with patch("reducto_cli.commands.parse.get_client") as mock_get_client, \
-         patch("reducto_cli.commands.parse.upload_file") as mock_upload, \
-         patch("reducto_cli.commands.parse.create_parse_job") as mock_create_job, \
          patch("reducto_cli.commands.parse.poll_job") as mock_poll:
 
-        # Setup mocks
+        # Setup mocks: the client's methods are patched directly
         mock_get_client.return_value = mock_reducto_client
-        mock_upload.return_value = mock_upload_result
-        mock_create_job.return_value = mock_job_response
+        mock_reducto_client.upload.return_value = mock_upload_result
+        mock_reducto_client.parse.run_job.return_value = mock_job_response
         mock_poll.return_value = mock_job_status_completed
 
         # Run the command
-        result = runner.invoke(app, ["parse", str(temp_pdf_file)])
+        result = runner.invoke(app, ["parse", str(temp_pdf_file), "-o", str(output_file)])
 
         # Verify success
         assert result.exit_code == 0
 
         # Verify the flow was called correctly
         mock_get_client.assert_called_once_with(environment="production")
-        mock_upload.assert_called_once()
-        mock_create_job.assert_called_once()
+        mock_reducto_client.upload.assert_called_once()
+        mock_reducto_client.parse.run_job.assert_called_once()
         mock_poll.assert_called_once_with(
             mock_reducto_client,
             mock_job_response.job_id,
             timeout=None
         )
 
-        # Verify output contains job data
-        assert "mock-job-id-456" in result.stdout or "completed" in result.stdout
+        # The upload streams an open binary handle, closed afterwards
+        uploaded = mock_reducto_client.upload.call_args.kwargs["file"]
+        assert uploaded.name == str(temp_pdf_file)
+        assert uploaded.closed
+
+        # Verify the result was saved with the job data
+        assert "Saved to" in result.stdout
+        assert "mock-job-id-456" in output_file.read_text()
+
+
+def test_parse_multiple_local_files(
+    tmp_path,
+    monkeypatch,
+    mock_reducto_client,
+    mock_upload_result,
+    mock_job_status_completed,
+    mock_env_api_key,
+):
+    """Test batch parsing of several local files in one invocation."""
+    monkeypatch.chdir(tmp_path)
+    files = []
+    for name in ("a.pdf", "b.pdf"):
+        f = tmp_path / name
+        f.write_text("Mock PDF content")
+        files.append(f)
 
+    job_response = MagicMock()
+    job_response.job_id = "mock-job-id-456"
 
-def test_upload_file_wrapper(mock_reducto_client, temp_pdf_file, mock_upload_result):
-    """Test the upload_file wrapper function."""
-    mock_reducto_client.upload.return_value = mock_upload_result
+    with patch("reducto_cli.commands.parse.get_client") as mock_get_client, \
+         patch("reducto_cli.commands.parse.poll_jobs") as mock_poll_jobs:
 
-    result = upload_file(mock_reducto_client, temp_pdf_file)
+        mock_get_client.return_value = mock_reducto_client
+        mock_reducto_client.upload.return_value = mock_upload_result
+        mock_reducto_client.parse.run_job.return_value = job_response
+        mock_poll_jobs.return_value = (
+            {"mock-job-id-456": mock_job_status_completed},
+            {},
+        )
 
-    assert result == mock_upload_result
-    mock_reducto_client.upload.assert_called_once_with(file=temp_pdf_file)
+        result = runner.invoke(
+            app, ["parse", str(files[0]), str(files[1]), "-o", str(tmp_path / "out.json")]
+        )
+        # --output is rejected for multiple inputs
+        assert result.exit_code == 1
 
+        result = runner.invoke(app, ["parse", str(files[0]), str(files[1])])
+        assert result.exit_code == 0
 
-def test_create_parse_job_wrapper(mock_reducto_client, mock_job_response):
-    """Test the create_parse_job wrapper function."""
-    mock_reducto_client.parse.run_job.return_value = mock_job_response
+        # Both files uploaded, both jobs submitted, one shared poll sweep
+        assert mock_reducto_client.upload.call_count == 2
+        assert mock_reducto_client.parse.run_job.call_count == 2
+        mock_poll_jobs.assert_called_once()
 
-    result = create_parse_job(
-        mock_reducto_client,
-        input="reducto://test-file-id",
-        settings={"timeout": 300}
-    )
 
-    assert result == mock_job_response
-    mock_reducto_client.parse.run_job.assert_called_once_with(
-        input="reducto://test-file-id",
-        settings={"timeout": 300}
-    )
+def test_parse_duplicate_stems_disambiguated(
+    tmp_path,
+    monkeypatch,
+    mock_reducto_client,
+    mock_upload_result,
+    mock_job_status_completed,
+    mock_env_api_key,
+):
+    """Test that same-named inputs from different dirs don't overwrite each other."""
+    from types import SimpleNamespace
+
+    monkeypatch.chdir(tmp_path)
+    files = []
+    for sub in ("a", "b"):
+        d = tmp_path / sub
+        d.mkdir()
+        f = d / "doc.pdf"
+        f.write_text("Mock PDF content")
+        files.append(f)
+
+    with patch("reducto_cli.commands.parse.get_client") as mock_get_client, \
+         patch("reducto_cli.commands.parse.poll_jobs") as mock_poll_jobs:
+
+        mock_get_client.return_value = mock_reducto_client
+        mock_reducto_client.upload.return_value = mock_upload_result
+        mock_reducto_client.parse.run_job.side_effect = [
+            SimpleNamespace(job_id="job-1"),
+            SimpleNamespace(job_id="job-2"),
+        ]
+        mock_poll_jobs.return_value = (
+            {"job-1": mock_job_status_completed, "job-2": mock_job_status_completed},
+            {},
+        )
+
+        result = runner.invoke(app, ["parse", str(files[0]), str(files[1])])
+        assert result.exit_code == 0
+
+        # Default names are suffixed with the job ID instead of colliding
+        assert (tmp_path / "doc_job-1.json").exists()
+        assert (tmp_path / "doc_job-2.json").exists()
+        assert not (tmp_path / "doc.json").exists()
@@ -1,11 +1,19 @@
 """Tests for utility functions."""
 
+import asyncio
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from reducto_cli.utils import get_job_status, poll_job, is_local_file
+from reducto_cli.utils import (
+    await_job,
+    get_job_status,
+    is_local_file,
+    poll_job,
+    poll_job_async,
+    poll_jobs,
+)
 
 
 def test_get_job_status_wrapper(mock_reducto_client, mock_job_status_completed):
@@ -22,16 +30,29 @@ def test_get_job_status_wrapper(mock_reducto_client, mock_job_status_completed):
     mock_reducto_client.job.get.assert_called_once_with("test-job-id")
 
 
+def test_get_job_status_dedup(mock_reducto_client):
+    """Test that rapid back-to-back status checks share one HTTP request."""
+    from types import SimpleNamespace
+
+    processing = SimpleNamespace(status="processing", job_id="dedup-job-id")
+    mock_reducto_client.job.get.return_value = processing
+
+    first = get_job_status(mock_reducto_client, "dedup-job-id")
+    second = get_job_status(mock_reducto_client, "dedup-job-id")
+
+    assert first is processing
+    assert second is processing
+    assert mock_reducto_client.job.get.call_count == 1
+
+
 def test_poll_job_success(mock_reducto_client, mock_job_status_completed):
     """Test that poll_job successfully polls until completion."""
-    # Mock get_job_status to return completed status
-    with patch("reducto_cli.utils.get_job_status") as mock_get_status:
-        mock_get_status.return_value = mock_job_status_completed
+    mock_reducto_client.job.get.return_value = mock_job_status_completed
 
-        result = poll_job(mock_reducto_client, "test-job-id", timeout=10)
+    result = poll_job(mock_reducto_client, "test-job-id", timeout=10)
 
-        assert result == mock_job_status_completed
-        mock_get_status.assert_called_once_with(mock_reducto_client, "test-job-id")
+    assert result == mock_job_status_completed
+    mock_reducto_client.job.get.assert_called_once_with("test-job-id")
 
 
 def test_poll_job_with_processing_then_completed(
@@ -39,12 +60,12 @@ def test_poll_job_with_processing_then_completed(
     mock_job_status_processing,
     mock_job_status_completed
 ):
-    """Test poll_job when job is processing then completes."""
-    with patch("reducto_cli.utils.get_job_status") as mock_get_status, \
-         patch("time.sleep"):  # Mock sleep to speed up test
-
-        # First call returns processing, second returns completed
-        mock_get_status.side_effect = [
+    """Test poll_job when job is processing then completes, with backoff."""
+    with patch("time.sleep") as mock_sleep:  # Mock sleep to speed up test
+        # Three processing polls, then completed
+        mock_reducto_client.job.get.side_effect = [
+            mock_job_status_processing,
+            mock_job_status_processing,
             mock_job_status_processing,
             mock_job_status_completed
         ]
@@ -52,18 +73,42 @@ def test_poll_job_with_processing_then_completed(
         result = poll_job(mock_reducto_client, "test-job-id", timeout=30)
 
         assert result == mock_job_status_completed
-        assert mock_get_status.call_count == 2
+        assert mock_reducto_client.job.get.call_count == 4
+        # Delay doubles per iteration: 0.25s, 0.5s, 1s
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.5, 1.0]
+
+
+def test_poll_job_adaptive_interval(mock_reducto_client, mock_job_status_completed):
+    """Test that poll_job schedules polls from the observed progress rate."""
+    from types import SimpleNamespace
+
+    with patch("time.monotonic") as mock_time, \
+         patch("time.sleep") as mock_sleep:
+
+        mock_reducto_client.job.get.side_effect = [
+            SimpleNamespace(status="processing", progress=0.5),
+            SimpleNamespace(status="processing", progress=0.8),
+            mock_job_status_completed,
+        ]
+        # Start, then one read per iteration
+        mock_time.side_effect = [0, 2, 4, 6]
+
+        result = poll_job(mock_reducto_client, "test-job-id")
+
+        assert result == mock_job_status_completed
+        # 50% done after 2s -> ~2s left; 80% done after 4s -> ~1s left
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([2.0, 1.0])
 
 
 def test_poll_job_timeout(mock_reducto_client, mock_job_status_processing):
     """Test that poll_job raises TimeoutError when timeout is reached."""
-    with patch("reducto_cli.utils.get_job_status") as mock_get_status, \
-         patch("time.time") as mock_time, \
+    with patch("time.monotonic") as mock_time, \
          patch("time.sleep"):
 
-        mock_get_status.return_value = mock_job_status_processing
-        # Simulate time passing
-        mock_time.side_effect = [0, 0, 11]  # Start, first check, timeout exceeded
+        mock_reducto_client.job.get.return_value = mock_job_status_processing
+        # One read at start (fixing the deadline), one per iteration
+        mock_time.side_effect = [0, 11]  # Start, timeout exceeded
 
         with pytest.raises(TimeoutError, match="Job timed out after 10 seconds"):
             poll_job(mock_reducto_client, "test-job-id", timeout=10)
@@ -71,11 +116,99 @@ def test_poll_job_timeout(mock_reducto_client, mock_job_status_processing):
 
 def test_poll_job_failed(mock_reducto_client, mock_job_status_failed):
     """Test that poll_job raises exception when job fails."""
-    with patch("reducto_cli.utils.get_job_status") as mock_get_status:
-        mock_get_status.return_value = mock_job_status_failed
+    mock_reducto_client.job.get.return_value = mock_job_status_failed
+
+    with pytest.raises(Exception, match="Job failed: Processing failed"):
+        poll_job(mock_reducto_client, "test-job-id")
+
+
+def test_poll_jobs_shared_sweep(mock_reducto_client):
+    """Test that poll_jobs amortizes one sleep per tick across all pending jobs."""
+    from types import SimpleNamespace
+
+    processing_a = SimpleNamespace(status="processing")
+    processing_b = SimpleNamespace(status="processing")
+    completed_a = SimpleNamespace(status="completed")
+    completed_b = SimpleNamespace(status="completed")
+
+    with patch("time.sleep") as mock_sleep:
+        # Tick 1: both processing; tick 2: a done, b processing; tick 3: b done
+        mock_reducto_client.job.get.side_effect = [
+            processing_a, processing_b,
+            completed_a, processing_b,
+            completed_b,
+        ]
+
+        results, failures = poll_jobs(mock_reducto_client, ["job-a", "job-b"], timeout=30)
 
-        with pytest.raises(Exception, match="Job failed: Processing failed"):
-            poll_job(mock_reducto_client, "test-job-id")
+        assert results == {"job-a": completed_a, "job-b": completed_b}
+        assert failures == {}
+        # One sleep per tick with jobs pending, not one per job
+        assert mock_sleep.call_count == 2
+
+
+def test_await_job_push_path():
+    """Test that await_job returns the pushed terminal event without sleeping."""
+    from types import SimpleNamespace
+
+    client = SimpleNamespace(base_url="https://api.example.com", api_key="test-key")
+    event = {"status": "completed", "job_id": "test-job-id"}
+
+    with patch("reducto_cli.utils._stream_job_events", new=AsyncMock(return_value=event)), \
+         patch("time.sleep") as mock_sleep:
+
+        result = await_job(client, "test-job-id", timeout=30)
+
+        assert result == event
+        mock_sleep.assert_not_called()
+
+
+def test_await_job_falls_back_to_polling(mock_job_status_completed):
+    """Test that await_job polls when the events stream is unavailable."""
+    from types import SimpleNamespace
+
+    client = SimpleNamespace(base_url="https://api.example.com", api_key="test-key")
+
+    with patch(
+        "reducto_cli.utils._stream_job_events",
+        new=AsyncMock(side_effect=RuntimeError("no events endpoint")),
+    ), patch("reducto_cli.utils.poll_job") as mock_poll:
+        mock_poll.return_value = mock_job_status_completed
+
+        result = await_job(client, "test-job-id", timeout=30)
+
+        assert result == mock_job_status_completed
+        mock_poll.assert_called_once_with(client, "test-job-id", timeout=30)
+
+
+def test_poll_job_async_processing_then_completed(
+    mock_job_status_processing,
+    mock_job_status_completed,
+):
+    """Test poll_job_async with an async client that completes on the second poll."""
+    client = MagicMock()
+    client.job.get = AsyncMock(
+        side_effect=[mock_job_status_processing, mock_job_status_completed]
+    )
+
+    with patch("asyncio.sleep", new=AsyncMock()):
+        result = asyncio.run(poll_job_async(client, "test-job-id", timeout=30))
+
+    assert result == mock_job_status_completed
+    assert client.job.get.await_count == 2
+
+
+def test_poll_job_async_timeout(mock_job_status_processing):
+    """Test that poll_job_async raises TimeoutError when the deadline passes."""
+    client = MagicMock()
+
+    async def slow_get(job_id):
+        await asyncio.sleep(10)
+
+    client.job.get = slow_get
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        asyncio.run(poll_job_async(client, "test-job-id", timeout=0.05))
 
 
 def test_is_local_file_exists(temp_pdf_file):
@@ -83,16 +216,32 @@ def test_is_local_file_exists(temp_pdf_file):
     assert is_local_file(str(temp_pdf_file)) is True
 
 
-def test_is_local_file_not_exists():
-    """Test is_local_file returns False for non-existent files."""
-    assert is_local_file("/path/to/nonexistent/file.pdf") is False
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/path/to/nonexistent/file.pdf",
+        "https://example.com/document.pdf",
+        "http://example.com/document.pdf",
+        "reducto://file-id-123",
+        "s3://bucket/document.pdf",
+    ],
+)
+def test_is_local_file_non_local(path):
+    """Test is_local_file returns False for missing paths and remote schemes."""
+    assert is_local_file(path) is False
+
 
+def test_is_local_file_cached(temp_pdf_file):
+    """Test that one stat serves repeated checks and a follow-up size lookup."""
+    import os
 
-def test_is_local_file_url():
-    """Test is_local_file returns False for URLs."""
-    assert is_local_file("https://example.com/document.pdf") is False
+    from reducto_cli.utils import _stat_cached
 
+    real_stat = os.stat(str(temp_pdf_file))
+    with patch("reducto_cli.utils.os.stat", return_value=real_stat) as mock_stat:
+        assert is_local_file(str(temp_pdf_file)) is True
+        assert is_local_file(str(temp_pdf_file)) is True
+        # Size lookup reuses the cached stat instead of re-statting
+        assert _stat_cached(str(temp_pdf_file)).st_size == real_stat.st_size
 
-def test_is_local_file_reducto_prefix():
-    """Test is_local_file returns False for reducto:// prefixes."""
-    assert is_local_file("reducto://file-id-123") is False
+        mock_stat.assert_called_once_with(str(temp_pdf_file))